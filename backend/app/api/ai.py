@@ -1,5 +1,6 @@
 """AI/Claude integration endpoints"""
 
+import logging
 from datetime import datetime
 from typing import Any
 
@@ -17,6 +18,8 @@ from app.services.ai_engine import (
 )
 from app.services.platform_manager import PlatformManager
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Request/Response Models
 # =============================================================================
@@ -162,7 +165,7 @@ async def analyze_campaigns(
                 c["platform"] = platform
             all_campaigns.extend(campaigns)
         except Exception as e:
-            print(f"[AI] Error fetching {platform}: {e}")
+            logger.warning("Error fetching %s: %s", platform, e)
 
     if not all_campaigns:
         raise HTTPException(status_code=404, detail="No campaign data available for analysis")
@@ -1,5 +1,6 @@
 """Campaign management API endpoints"""
 
+import logging
 from datetime import date
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -10,6 +11,8 @@ from app.api.deps import AnalystUser, ManagerUser, ViewerUser
 from app.core.database import get_db
 from app.services.platform_manager import PlatformManager
 
+logger = logging.getLogger(__name__)
+
 # =============================================================================
 # Pydantic Models
 # =============================================================================
@@ -148,7 +151,7 @@ async def get_campaign_performance(
 
     # Log errors but don't fail the request
     if errors:
-        print(f"[API] Errors fetching campaigns: {errors}")
+        logger.warning("Errors fetching campaigns: %s", errors)
 
     return CampaignResponse(
         campaigns=all_campaigns,
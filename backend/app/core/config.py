@@ -26,6 +26,7 @@ class Settings(BaseSettings):
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
+    bcrypt_rounds: int = 12  # Work factor (cost doubles per round)
 
     # Database
     database_url: str = (
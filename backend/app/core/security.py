@@ -1,9 +1,17 @@
 """Security utilities for JWT tokens and password hashing"""
 
+import base64
+import hashlib
+import hmac
+import threading
+import time
+from calendar import timegm
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
 import bcrypt
+import orjson
 from jose import JWTError, jwt
 
 from app.core.config import settings
@@ -25,20 +33,67 @@ def hash_password(password: str) -> str:
     Note: bcrypt truncates passwords to 72 bytes for security reasons.
     We explicitly truncate here to avoid ValueError on long passwords.
     """
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_rounds)
     # bcrypt only uses first 72 bytes of password
     password_bytes = password.encode("utf-8")[:72]
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode("utf-8")
 
 
+# Fast path for the standard {"sub", "email", "role"} access-token claims.
+# Produces byte-identical output to jose's HS256 encoder (compact JSON, sorted
+# header, claims in insertion order) without per-call dict serialization or
+# HMAC key setup. Only taken when the claims arrive in exactly this order.
+_HS256_HEADER_B64 = base64.urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+_FAST_ACCESS_CLAIMS = ("sub", "email", "role")
+
+
+@lru_cache(maxsize=4)
+def _hmac_prototype(secret_key: str) -> hmac.HMAC:
+    """Keyed HMAC-SHA256 prototype; callers .copy() it instead of re-keying"""
+    return hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+
+def _is_plain_claim(value: Any) -> bool:
+    """True if orjson escapes value exactly as jose's json.dumps would.
+
+    Exact type check: str subclasses such as UserRole members are left to jose.
+    """
+    return type(value) is str and value.isascii() and value.isprintable()  # noqa: E721
+
+
+def _fast_encode_access(sub: str, email: str, role: str, exp: int) -> str:
+    """Encode an HS256 access token for plain-ASCII standard claims"""
+    payload = b'{"sub":%b,"email":%b,"role":%b,"exp":%d,"type":"access"}' % (
+        orjson.dumps(sub),
+        orjson.dumps(email),
+        orjson.dumps(role),
+        exp,
+    )
+    signing_input = _HS256_HEADER_B64 + b"." + base64.urlsafe_b64encode(payload).rstrip(b"=")
+    mac = _hmac_prototype(settings.secret_key).copy()
+    mac.update(signing_input)
+    signature = base64.urlsafe_b64encode(mac.digest()).rstrip(b"=")
+    return (signing_input + b"." + signature).decode()
+
+
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token"""
-    to_encode = data.copy()
     if expires_delta:
         expire = datetime.now(UTC) + expires_delta
     else:
         expire = datetime.now(UTC) + timedelta(minutes=settings.access_token_expire_minutes)
+
+    if (
+        settings.algorithm == "HS256"
+        and tuple(data) == _FAST_ACCESS_CLAIMS
+        and all(_is_plain_claim(data[claim]) for claim in _FAST_ACCESS_CLAIMS)
+    ):
+        return _fast_encode_access(
+            data["sub"], data["email"], data["role"], timegm(expire.utctimetuple())
+        )
+
+    to_encode = data.copy()
     to_encode.update({"exp": expire, "type": "access"})
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
@@ -54,10 +109,67 @@ def create_refresh_token(data: dict[str, Any], expires_delta: timedelta | None =
     return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
 
 
+# Decoded token caches. Valid tokens map to (exp, payload) and live until their
+# own exp claim; invalid tokens map to a short expiry in a separate, smaller cache
+# so a flood of garbage tokens cannot evict valid entries. Sync dependencies run
+# decode_token in the threadpool, so all cache access goes through the lock.
+_TOKEN_CACHE_MAXSIZE = 4096
+_INVALID_TOKEN_CACHE_MAXSIZE = 256
+_INVALID_TOKEN_TTL_SECONDS = 60
+_MIN_TOKEN_LENGTH = 20
+_token_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_invalid_token_cache: dict[str, float] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _cache_put(cache: dict[str, Any], maxsize: int, token: str, entry: Any) -> None:
+    """Store a decode result, evicting the oldest entry when the cache is full"""
+    with _token_cache_lock:
+        if token not in cache and len(cache) >= maxsize:
+            cache.pop(next(iter(cache)), None)
+        cache[token] = entry
+
+
+def clear_token_cache() -> None:
+    """Drop all cached decode results (e.g. after rotating the secret key)"""
+    with _token_cache_lock:
+        _token_cache.clear()
+        _invalid_token_cache.clear()
+
+
 def decode_token(token: str) -> dict[str, Any] | None:
-    """Decode and validate a JWT token"""
+    """Decode and validate a JWT token (results cached until token expiry)"""
+    # Reject anything that is not header.payload.signature before touching the cache
+    if not token or token.count(".") != 2 or len(token) < _MIN_TOKEN_LENGTH:
+        return None
+
+    now = time.time()
+    with _token_cache_lock:
+        cached = _token_cache.get(token)
+        if cached is not None and now >= cached[0]:
+            del _token_cache[token]
+            cached = None
+        invalid_until = _invalid_token_cache.get(token)
+        if invalid_until is not None and now >= invalid_until:
+            del _invalid_token_cache[token]
+            invalid_until = None
+    if cached is not None:
+        return dict(cached[1])
+    if invalid_until is not None:
+        return None
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
-        return payload
     except JWTError:
+        _cache_put(
+            _invalid_token_cache,
+            _INVALID_TOKEN_CACHE_MAXSIZE,
+            token,
+            now + _INVALID_TOKEN_TTL_SECONDS,
+        )
         return None
+
+    exp = payload.get("exp")
+    if isinstance(exp, int | float):
+        _cache_put(_token_cache, _TOKEN_CACHE_MAXSIZE, token, (float(exp), payload))
+    return dict(payload)
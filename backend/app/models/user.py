@@ -11,13 +11,63 @@ from app.core.database import Base
 
 
 class UserRole(str, Enum):
-    """User roles for RBAC"""
+    """User roles for RBAC, ordered by permission level.
+
+    Values stay the role strings stored in the database; comparison operators
+    use the numeric level, so ``UserRole.MANAGER >= UserRole.ANALYST`` is a
+    single int compare.
+    """
+
+    level: int  # Set from ROLE_HIERARCHY below
 
     ADMIN = "admin"  # Full access + user management
     MANAGER = "manager"  # Modify budgets, accept recommendations
     ANALYST = "analyst"  # View data, analyze, reject recommendations
     VIEWER = "viewer"  # Read-only dashboard access
 
+    @classmethod
+    def _set_levels(cls, hierarchy: dict["UserRole", int]) -> None:
+        """Attach each member's permission level"""
+        for role, level in hierarchy.items():
+            role.level = level
+
+    @staticmethod
+    def _level_of(other) -> int | None:
+        """Return the level of a role or role string, or None if other is neither.
+
+        Plain strings (e.g. a role read from a JWT payload) compare by level
+        rather than falling back to str ordering; unknown role strings are
+        level 0, as in has_role_permission.
+        """
+        if isinstance(other, UserRole):
+            return other.level
+        if isinstance(other, str):
+            try:
+                return UserRole(other).level
+            except ValueError:
+                return 0
+        return None
+
+    def __ge__(self, other):
+        if (level := self._level_of(other)) is not None:
+            return self.level >= level
+        return NotImplemented
+
+    def __gt__(self, other):
+        if (level := self._level_of(other)) is not None:
+            return self.level > level
+        return NotImplemented
+
+    def __le__(self, other):
+        if (level := self._level_of(other)) is not None:
+            return self.level <= level
+        return NotImplemented
+
+    def __lt__(self, other):
+        if (level := self._level_of(other)) is not None:
+            return self.level < level
+        return NotImplemented
+
 
 # Role hierarchy for permission checks
 ROLE_HIERARCHY = {
@@ -27,9 +77,14 @@ ROLE_HIERARCHY = {
     UserRole.VIEWER: 1,
 }
 
+UserRole._set_levels(ROLE_HIERARCHY)
+
 
 def has_role_permission(user_role: UserRole, required_role: UserRole) -> bool:
     """Check if user_role has at least the permissions of required_role"""
+    if isinstance(user_role, UserRole) and isinstance(required_role, UserRole):
+        return user_role >= required_role
+    # Unknown roles are treated as level 0
     return ROLE_HIERARCHY.get(user_role, 0) >= ROLE_HIERARCHY.get(required_role, 0)
 
 
@@ -1,8 +1,18 @@
 """JSON-RPC 2.0 client for MCP servers"""
 
+import asyncio
+import itertools
 from typing import Any
 
 import httpx
+import orjson
+
+# Constant parts of every JSON-RPC request; httpx copies headers, so sharing is safe
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_LIST_TOOLS_ENVELOPE = {"jsonrpc": "2.0", "method": "tools/list", "params": {}}
+
+# Whole health probe (HEAD plus any tools/list fallback) must finish within this
+_PING_TIMEOUT = 2.0
 
 
 class MCPClient:
@@ -13,11 +23,24 @@ class MCPClient:
     This client handles the JSON-RPC communication.
     """
 
-    def __init__(self, server_url: str, server_name: str):
+    def __init__(
+        self,
+        server_url: str,
+        server_name: str,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 8,
+        ping_url: str | None = None,
+    ):
         self.server_url = server_url
         self.server_name = server_name
-        self.client = httpx.AsyncClient(timeout=30.0)
-        self.request_id = 0
+        self.ping_url = ping_url  # Optional HEAD health endpoint; None probes with tools/list
+        # An injected client is shared (and closed) by its owner, e.g. PlatformManager
+        self._owns_client = client is None
+        self.client = client if client is not None else httpx.AsyncClient(timeout=30.0)
+        self._id_counter = itertools.count(1)
+        self.request_id = 0  # Last id issued
+        # Caps in-flight requests to this server so large fan-outs queue here
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def call_tool(
         self,
@@ -37,11 +60,9 @@ class MCPClient:
         Raises:
             Exception: If tool call fails
         """
-        self.request_id += 1
-
         payload = {
             "jsonrpc": "2.0",
-            "id": self.request_id,
+            "id": self._next_id(),
             "method": "tools/call",
             "params": {
                 "name": tool_name,
@@ -50,52 +71,148 @@ class MCPClient:
         }
 
         try:
-            response = await self.client.post(
-                self.server_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if "error" in result:
-                raise Exception(f"MCP Error from {self.server_name}: {result['error']}")
+            async with self._semaphore:
+                response = await self.client.post(
+                    self.server_url,
+                    content=orjson.dumps(payload),
+                    headers=_JSON_HEADERS,
+                )
+            if not response.is_success:
+                raise Exception(
+                    f"HTTP error calling {self.server_name}: HTTP {response.status_code}"
+                )
+
+            result = orjson.loads(response.content)
+
+            if (error := result.get("error")) is not None:
+                raise Exception(f"MCP Error from {self.server_name}: {error}")
 
             return result.get("result", {})
 
         except httpx.HTTPError as e:
             raise Exception(f"HTTP error calling {self.server_name}: {str(e)}")
 
-    async def list_tools(self) -> list[dict[str, Any]]:
-        """List available tools from MCP server"""
-        self.request_id += 1
+    async def call_tools_batch(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+    ) -> list[dict[str, Any] | Exception]:
+        """
+        Call several MCP tools in a single JSON-RPC batch request.
 
-        payload = {
-            "jsonrpc": "2.0",
-            "id": self.request_id,
-            "method": "tools/list",
-            "params": {},
-        }
+        Args:
+            calls: (tool_name, arguments) pairs
+
+        Returns:
+            One entry per call, in the order given: the tool result, or an
+            Exception if that call failed
+
+        Raises:
+            Exception: If the batch request itself fails
+        """
+        if not calls:
+            return []
+
+        ids = [self._next_id() for _ in calls]
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments,
+                },
+            }
+            for request_id, (tool_name, arguments) in zip(ids, calls, strict=True)
+        ]
 
         try:
-            response = await self.client.post(self.server_url, json=payload)
-            response.raise_for_status()
+            async with self._semaphore:
+                response = await self.client.post(
+                    self.server_url,
+                    content=orjson.dumps(payload),
+                    headers=_JSON_HEADERS,
+                )
+        except httpx.HTTPError as e:
+            raise Exception(f"HTTP error calling {self.server_name}: {str(e)}")
+
+        if not response.is_success:
+            raise Exception(f"HTTP error calling {self.server_name}: HTTP {response.status_code}")
+
+        result = orjson.loads(response.content)
 
-            result = response.json()
-            return result.get("result", {}).get("tools", [])
+        if not isinstance(result, list):
+            # Servers answer a batch with a single error object when the batch itself is invalid
+            raise Exception(f"MCP Error from {self.server_name}: {result.get('error', result)}")
 
+        # Responses may arrive in any order; match them back up by id. Entries that
+        # are not JSON objects cannot be matched and surface as missing responses.
+        by_id = {item.get("id"): item for item in result if isinstance(item, dict)}
+
+        results: list[dict[str, Any] | Exception] = []
+        for request_id in ids:
+            item = by_id.get(request_id)
+            if item is None:
+                results.append(
+                    Exception(f"MCP Error from {self.server_name}: no response for id {request_id}")
+                )
+            elif (error := item.get("error")) is not None:
+                results.append(Exception(f"MCP Error from {self.server_name}: {error}"))
+            else:
+                results.append(item.get("result", {}))
+        return results
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """List available tools from MCP server"""
+        try:
+            async with self._semaphore:
+                return await self._fetch_tools()
         except Exception as e:
             raise Exception(f"Failed to list tools from {self.server_name}: {str(e)}")
 
+    async def _fetch_tools(self) -> list[dict[str, Any]]:
+        """Send tools/list (without taking the concurrency semaphore)"""
+        payload = {**_LIST_TOOLS_ENVELOPE, "id": self._next_id()}
+        response = await self.client.post(
+            self.server_url,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+        if not response.is_success:
+            raise Exception(f"HTTP {response.status_code}")
+
+        result = orjson.loads(response.content)
+        return result.get("result", {}).get("tools", [])
+
     async def ping(self) -> bool:
-        """Check if MCP server is alive"""
+        """Check if MCP server is alive within _PING_TIMEOUT.
+
+        Probes bypass the concurrency semaphore so health checks never queue
+        behind slow tool calls.
+        """
         try:
-            await self.list_tools()
-            return True
+            return await asyncio.wait_for(self._probe(), _PING_TIMEOUT)
         except Exception:
             return False
 
+    async def _probe(self) -> bool:
+        """HEAD ping_url if configured (2xx alive, 5xx down), else confirm with tools/list"""
+        if self.ping_url is not None:
+            response = await self.client.head(self.ping_url)
+            if response.is_success:
+                return True
+            if response.is_server_error:
+                return False
+
+        await self._fetch_tools()
+        return True
+
+    def _next_id(self) -> int:
+        """Return the next JSON-RPC request id"""
+        self.request_id = next(self._id_counter)
+        return self.request_id
+
     async def close(self):
-        """Close HTTP client connection"""
-        await self.client.aclose()
+        """Close HTTP client connection (no-op for a shared client)"""
+        if self._owns_client:
+            await self.client.aclose()
@@ -1,14 +1,21 @@
 """Platform Manager - Unified interface to all advertising platforms via MCP"""
 
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+import httpx
+import orjson
+
 from app.core.config import settings
 
 from .mcp_client import MCPClient
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MCPConfig:
     """MCP Server configuration"""
 
@@ -17,6 +24,21 @@ class MCPConfig:
     meta_ads_port: int = 3002
     tiktok_ads_port: int = 3003
     linkedin_ads_port: int = 3004
+    perf_cache_ttl_seconds: float = 30.0  # 0 disables the performance cache
+    perf_cache_maxsize: int = 256  # Least recently used entries are evicted beyond this
+    max_concurrency: int = 8  # In-flight requests allowed per MCP server
+    ping_endpoint: str = ""  # HEAD health path on each server; "" probes with tools/list
+
+    @classmethod
+    def from_settings(cls) -> "MCPConfig":
+        """Build the configuration described by the current application settings"""
+        return cls(
+            host=settings.mcp_host,
+            google_ads_port=settings.mcp_google_ads_port,
+            meta_ads_port=settings.mcp_meta_ads_port,
+            tiktok_ads_port=settings.mcp_tiktok_ads_port,
+            linkedin_ads_port=settings.mcp_linkedin_ads_port,
+        )
 
 
 class PlatformManager:
@@ -27,39 +49,63 @@ class PlatformManager:
     for campaign management across Google Ads, Meta Ads, TikTok Ads, etc.
     """
 
+    # Budget argument name and whole-cents -> platform unit conversion, per platform
+    _BUDGET_FORMAT: dict[str, tuple[str, Callable[[int], int | float]]] = {
+        # Google uses micros (1 USD = 1,000,000 micros = 100 cents)
+        "google_ads": ("new_budget_micros", lambda cents: cents * 10_000),
+        # Other platforms use standard currency
+        "meta_ads": ("new_budget", lambda cents: cents / 100),
+        "tiktok_ads": ("new_budget", lambda cents: cents / 100),
+        "linkedin_ads": ("new_budget", lambda cents: cents / 100),
+    }
+
+    # MCP server name per platform
+    _SERVER_NAMES = {
+        "google_ads": "google-ads-mcp",
+        "meta_ads": "meta-ads-mcp",
+        "tiktok_ads": "tiktok-ads-mcp",
+        "linkedin_ads": "linkedin-ads-mcp",
+    }
+
     def __init__(self, config: MCPConfig | None = None):
         if config is None:
-            config = MCPConfig(
-                host=settings.mcp_host,
-                google_ads_port=settings.mcp_google_ads_port,
-                meta_ads_port=settings.mcp_meta_ads_port,
-                tiktok_ads_port=settings.mcp_tiktok_ads_port,
-                linkedin_ads_port=settings.mcp_linkedin_ads_port,
-            )
+            config = MCPConfig.from_settings()
 
         self.config = config
-        base_url = f"http://{config.host}"
+
+        # Server URL per platform, computed once
+        ports = {
+            "google_ads": config.google_ads_port,
+            "meta_ads": config.meta_ads_port,
+            "tiktok_ads": config.tiktok_ads_port,
+            "linkedin_ads": config.linkedin_ads_port,
+        }
+        self._urls = {platform: f"http://{config.host}:{port}" for platform, port in ports.items()}
+
+        # One connection pool shared by every platform client
+        self._http = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
 
         # Initialize MCP clients for each platform
         self.clients = {
-            "google_ads": MCPClient(
-                server_url=f"{base_url}:{config.google_ads_port}",
-                server_name="google-ads-mcp",
-            ),
-            "meta_ads": MCPClient(
-                server_url=f"{base_url}:{config.meta_ads_port}",
-                server_name="meta-ads-mcp",
-            ),
-            "tiktok_ads": MCPClient(
-                server_url=f"{base_url}:{config.tiktok_ads_port}",
-                server_name="tiktok-ads-mcp",
-            ),
-            "linkedin_ads": MCPClient(
-                server_url=f"{base_url}:{config.linkedin_ads_port}",
-                server_name="linkedin-ads-mcp",
-            ),
+            platform: MCPClient(
+                server_url=url,
+                server_name=self._SERVER_NAMES[platform],
+                client=self._http,
+                max_concurrency=config.max_concurrency,
+                ping_url=f"{url}{config.ping_endpoint}" if config.ping_endpoint else None,
+            )
+            for platform, url in self._urls.items()
         }
 
+        # (platform, start_date, end_date, campaign_ids) -> (fetched_at, serialized result),
+        # in LRU order. Storing JSON bytes gives every hit its own copy via orjson.loads.
+        self._perf_cache: OrderedDict[tuple, tuple[float, bytes]] = OrderedDict()
+        # Bumped by invalidate_cache so fetches started before a mutation are not cached
+        self._cache_generation = dict.fromkeys(self.clients, 0)
+
     async def get_campaign_performance(
         self,
         platform: str,
@@ -78,9 +124,23 @@ class PlatformManager:
 
         Returns:
             Dict containing campaign performance data
+
+        Identical requests within config.perf_cache_ttl_seconds are served
+        from a local cache (as copies, so callers may mutate them); mutating
+        calls invalidate their platform's entries.
         """
         client = self._get_client(platform)
 
+        ttl = self.config.perf_cache_ttl_seconds
+        key = (platform, start_date, end_date, tuple(campaign_ids or ()))
+        cached = self._perf_cache.get(key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < ttl:
+                self._perf_cache.move_to_end(key)
+                return orjson.loads(cached[1])
+            del self._perf_cache[key]
+        generation = self._cache_generation[platform]
+
         args = {
             "date_range": {
                 "start_date": start_date,
@@ -91,7 +151,24 @@ class PlatformManager:
         if campaign_ids:
             args["campaign_ids"] = campaign_ids
 
-        return await client.call_tool("get_campaign_performance", args)
+        result = await client.call_tool("get_campaign_performance", args)
+        if ttl > 0 and generation == self._cache_generation[platform]:
+            self._perf_cache[key] = (time.monotonic(), orjson.dumps(result))
+            self._perf_cache.move_to_end(key)
+            while len(self._perf_cache) > self.config.perf_cache_maxsize:
+                self._perf_cache.popitem(last=False)
+        return result
+
+    def invalidate_cache(self, platform: str | None = None) -> None:
+        """Drop cached performance data for one platform, or for all platforms"""
+        platforms = list(self._cache_generation) if platform is None else [platform]
+        for name in platforms:
+            self._cache_generation[name] += 1
+        if platform is None:
+            self._perf_cache.clear()
+            return
+        for key in [key for key in self._perf_cache if key[0] == platform]:
+            del self._perf_cache[key]
 
     async def update_campaign_budget(
         self,
@@ -111,23 +188,38 @@ class PlatformManager:
             Result of budget update
         """
         client = self._get_client(platform)
+        args = self._budget_args(platform, campaign_id, new_budget)
+        try:
+            return await client.call_tool("update_campaign_budget", args)
+        finally:
+            self.invalidate_cache(platform)
 
-        # Convert to platform-specific format
-        if platform == "google_ads":
-            # Google uses micros (1 USD = 1,000,000 micros)
-            budget_value = int(new_budget * 1_000_000)
-            arg_name = "new_budget_micros"
-        else:
-            # Most other platforms use standard currency
-            budget_value = new_budget
-            arg_name = "new_budget"
+    async def update_campaign_budgets_bulk(
+        self,
+        platform: str,
+        updates: dict[str, float],
+    ) -> dict[str, dict[str, Any] | Exception]:
+        """
+        Update several campaign budgets on one platform in a single request.
 
-        args = {
-            "campaign_id": campaign_id,
-            arg_name: budget_value,
-        }
+        Args:
+            platform: Platform identifier
+            updates: Mapping of campaign ID to new budget in USD
 
-        return await client.call_tool("update_campaign_budget", args)
+        Returns:
+            Mapping of campaign ID to its update result, or the Exception
+            raised for that campaign
+        """
+        client = self._get_client(platform)
+        calls = [
+            ("update_campaign_budget", self._budget_args(platform, campaign_id, new_budget))
+            for campaign_id, new_budget in updates.items()
+        ]
+        try:
+            results = await client.call_tools_batch(calls)
+        finally:
+            self.invalidate_cache(platform)
+        return dict(zip(updates, results, strict=True))
 
     async def pause_campaign(
         self,
@@ -136,7 +228,10 @@ class PlatformManager:
     ) -> dict[str, Any]:
         """Pause campaign on any platform"""
         client = self._get_client(platform)
-        return await client.call_tool("pause_campaign", {"campaign_id": campaign_id})
+        try:
+            return await client.call_tool("pause_campaign", {"campaign_id": campaign_id})
+        finally:
+            self.invalidate_cache(platform)
 
     async def resume_campaign(
         self,
@@ -145,7 +240,10 @@ class PlatformManager:
     ) -> dict[str, Any]:
         """Resume paused campaign"""
         client = self._get_client(platform)
-        return await client.call_tool("resume_campaign", {"campaign_id": campaign_id})
+        try:
+            return await client.call_tool("resume_campaign", {"campaign_id": campaign_id})
+        finally:
+            self.invalidate_cache(platform)
 
     async def get_all_campaigns(
         self,
@@ -153,44 +251,60 @@ class PlatformManager:
         end_date: str,
     ) -> dict[str, Any]:
         """
-        Fetch campaigns from all platforms.
+        Fetch campaigns from all platforms in parallel.
 
         Returns:
             Dict mapping platform names to campaign lists
         """
-        results = {}
-
-        for platform in self.clients:
-            try:
-                results[platform] = await self.get_campaign_performance(
+        platforms = list(self.clients)
+        raw = await asyncio.gather(
+            *(
+                self.get_campaign_performance(
                     platform=platform,
                     start_date=start_date,
                     end_date=end_date,
                 )
-            except Exception as e:
-                results[platform] = {"error": str(e)}
+                for platform in platforms
+            ),
+            return_exceptions=True,
+        )
 
-        return results
+        return {
+            platform: {"error": str(result)} if isinstance(result, BaseException) else result
+            for platform, result in zip(platforms, raw, strict=True)
+        }
 
     async def health_check(self) -> dict[str, bool]:
-        """Check health of all MCP servers"""
-        results = {}
-        for platform, client in self.clients.items():
-            try:
-                results[platform] = await client.ping()
-            except Exception:
-                results[platform] = False
-        return results
+        """Check health of all MCP servers concurrently"""
+        platforms = list(self.clients)
+        raw = await asyncio.gather(
+            *(client.ping() for client in self.clients.values()),
+            return_exceptions=True,
+        )
+        return {
+            platform: False if isinstance(result, BaseException) else result
+            for platform, result in zip(platforms, raw, strict=True)
+        }
 
-    def _get_client(self, platform: str) -> MCPClient:
-        """Get MCP client for platform"""
-        if platform not in self.clients:
+    def _budget_args(self, platform: str, campaign_id: str, new_budget: float) -> dict[str, Any]:
+        """Build update_campaign_budget arguments in the platform's budget format"""
+        budget_format = self._BUDGET_FORMAT.get(platform)
+        if budget_format is None:
             raise ValueError(
-                f"Unknown platform: {platform}. Available: {list(self.clients.keys())}"
+                f"Unknown platform: {platform}. Available: {list(self._BUDGET_FORMAT)}"
             )
-        return self.clients[platform]
+        arg_name, transform = budget_format
+        # Round to whole cents first so e.g. 8.20 USD is 8_200_000 micros, not int(8199999.99...)
+        cents = round(new_budget * 100)
+        return {"campaign_id": campaign_id, arg_name: transform(cents)}
+
+    def _get_client(self, platform: str) -> MCPClient:
+        """Get MCP client for platform"""
+        client = self.clients.get(platform)
+        if client is None:
+            raise ValueError(f"Unknown platform: {platform}. Available: {list(self.clients)}")
+        return client
 
     async def close_all(self):
         """Close all MCP client connections"""
-        for client in self.clients.values():
-            await client.close()
+        await self._http.aclose()
@@ -0,0 +1,40 @@
+"""Shared helpers for the backend test suite"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+import orjson
+from fastapi import FastAPI
+
+_MISSING = object()
+
+
+@contextmanager
+def override_dep(app: FastAPI, dependency: Callable, override: Callable) -> Iterator[None]:
+    """Temporarily override a FastAPI dependency, restoring the previous override on exit"""
+    previous: Any = app.dependency_overrides.get(dependency, _MISSING)
+    app.dependency_overrides[dependency] = override
+    try:
+        yield
+    finally:
+        if previous is _MISSING:
+            app.dependency_overrides.pop(dependency, None)
+        else:
+            app.dependency_overrides[dependency] = previous
+
+
+def assert_success_response(resp: Any, status: int = 200, **expected: Any) -> dict[str, Any]:
+    """Assert an API response succeeded with the expected fields; return its JSON body"""
+    assert resp.status_code == status
+    data = resp.json()
+    assert data.get("success") is True
+    for key, value in expected.items():
+        assert data[key] == value
+    return data
+
+
+def make_mcp_response(payload: Any) -> httpx.Response:
+    """Successful MCP HTTP response whose body is the given JSON-RPC payload"""
+    return httpx.Response(200, content=orjson.dumps(payload))
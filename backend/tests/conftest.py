@@ -0,0 +1,130 @@
+"""Shared pytest fixtures for the backend test suite"""
+
+import os
+from datetime import timedelta
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+from app.core.config import Settings, settings
+from app.core.security import create_access_token, create_refresh_token, hash_password
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+# Minimum bcrypt work factor; same algorithm, 256x cheaper than the default 12
+FAST_BCRYPT_ROUNDS = 4
+
+# Fixed plaintexts whose bcrypt hashes are computed once per session
+KNOWN_PASSWORDS = [
+    "correctpassword",
+    "mypassword123",
+    "password123",
+    "securepassword123",
+    "adminpassword123",
+]
+
+UNICODE_PASSWORDS = [
+    "пароль123",  # Russian
+    "密码测试123",  # Chinese
+    "كلمة السر",  # Arabic
+    "パスワード",  # Japanese
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_bcrypt():
+    """Use the minimum bcrypt work factor unless BCRYPT_ROUNDS is set explicitly"""
+    if "BCRYPT_ROUNDS" in os.environ:
+        yield
+        return
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "bcrypt_rounds", FAST_BCRYPT_ROUNDS)
+        yield
+
+
+@pytest.fixture
+def production_bcrypt(monkeypatch):
+    """Restore the production bcrypt work factor for cost-sensitive tests"""
+    monkeypatch.setattr(settings, "bcrypt_rounds", Settings().bcrypt_rounds)
+
+
+@pytest.fixture(scope="session")
+def password_hashes():
+    """Map of known plaintext passwords to precomputed bcrypt hashes"""
+    return {pwd: hash_password(pwd) for pwd in KNOWN_PASSWORDS}
+
+
+@pytest.fixture(scope="session")
+def unicode_hashes():
+    """Map of Unicode plaintext passwords to precomputed bcrypt hashes"""
+    return {pwd: hash_password(pwd) for pwd in UNICODE_PASSWORDS}
+
+
+@pytest.fixture(scope="session")
+def canned_tokens():
+    """Tokens that endpoint tests only need the server to reject"""
+    return {
+        "access": create_access_token({"sub": "user123", "email": "test@example.com"}),
+        "refresh": create_refresh_token({"sub": "user123", "email": "test@example.com"}),
+        "analyst_access": create_access_token(
+            {"sub": "user123", "email": "analyst@example.com", "role": "analyst"}
+        ),
+        "expired_access": create_access_token(
+            {"sub": "user123", "email": "test@example.com"},
+            expires_delta=timedelta(seconds=-1),
+        ),
+    }
+
+
+@pytest.fixture
+def mock_db_factory():
+    """Build mock DB sessions whose query().filter().first() returns a given object"""
+
+    def _make(returning=None):
+        db = Mock(spec=Session)
+        db.query.return_value.filter.return_value.first.return_value = returning
+        return db
+
+    return _make
+
+
+@pytest.fixture
+async def platform_manager():
+    """Fresh PlatformManager per test, so client mocks and cached data never leak"""
+    from app.services.platform_manager import PlatformManager
+
+    manager = PlatformManager()
+    yield manager
+    await manager.close_all()
+
+
+@pytest.fixture
+def mock_platform_manager(platform_manager):
+    """platform_manager with every client call mocked"""
+    for client in platform_manager.clients.values():
+        client.call_tool = AsyncMock()
+        client.ping = AsyncMock(return_value=True)
+    return platform_manager
+
+
+@pytest.fixture(scope="session")
+def app_instance():
+    """The FastAPI app, imported lazily so non-HTTP tests skip app setup"""
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture(scope="session")
+def client(app_instance):
+    """Shared test client"""
+    with TestClient(app_instance) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+async def async_client(app_instance):
+    """Async client bound directly to the ASGI app (no thread portal)"""
+    transport = httpx.ASGITransport(app=app_instance)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
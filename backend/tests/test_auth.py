@@ -8,17 +8,10 @@ from app.core.security import (
     hash_password,
     verify_password,
 )
-from app.main import app
 from app.models.user import UserRole, has_role_permission
 from fastapi.testclient import TestClient
 
 
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
-
 class TestPasswordHashing:
     """Tests for password hashing utilities"""
 
@@ -49,31 +42,31 @@ class TestPasswordHashing:
 class TestJWTTokens:
     """Tests for JWT token creation and validation"""
 
-    def test_create_access_token(self):
+    @pytest.fixture(scope="module")
+    def tokens(self):
+        """Sign one access and one refresh token shared across the class"""
         data = {"sub": "user123", "email": "test@example.com"}
-        token = create_access_token(data)
+        return {"access": create_access_token(data), "refresh": create_refresh_token(data)}
+
+    def test_create_access_token(self, tokens):
+        token = tokens["access"]
         assert token is not None
         assert len(token) > 50
 
-    def test_create_refresh_token(self):
-        data = {"sub": "user123", "email": "test@example.com"}
-        token = create_refresh_token(data)
+    def test_create_refresh_token(self, tokens):
+        token = tokens["refresh"]
         assert token is not None
         assert len(token) > 50
 
-    def test_decode_access_token(self):
-        data = {"sub": "user123", "email": "test@example.com"}
-        token = create_access_token(data)
-        decoded = decode_token(token)
+    def test_decode_access_token(self, tokens):
+        decoded = decode_token(tokens["access"])
         assert decoded is not None
         assert decoded["sub"] == "user123"
         assert decoded["email"] == "test@example.com"
         assert decoded["type"] == "access"
 
-    def test_decode_refresh_token(self):
-        data = {"sub": "user123", "email": "test@example.com"}
-        token = create_refresh_token(data)
-        decoded = decode_token(token)
+    def test_decode_refresh_token(self, tokens):
+        decoded = decode_token(tokens["refresh"])
         assert decoded is not None
         assert decoded["sub"] == "user123"
         assert decoded["type"] == "refresh"
@@ -1,15 +1,49 @@
 """Tests for campaigns API endpoints"""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 from app.api.campaigns import get_platform_manager
 from app.api.deps import get_current_user
-from app.main import app
 from app.models.user import User, UserRole
-from fastapi.testclient import TestClient
 
+from tests._helpers import assert_success_response, override_dep
 
+# Canned MCP tool results shared by the tests below (read-only by convention;
+# the endpoints check isinstance(result, dict), so they stay plain dicts)
+CAMPAIGN_PERF_RESULT = {
+    "campaigns": [
+        {
+            "campaign_id": "123",
+            "campaign_name": "Test Campaign",
+            "status": "ENABLED",
+            "budget_usd": 100.0,
+            "impressions": 10000,
+            "clicks": 500,
+            "cost_usd": 50.0,
+            "conversions": 10,
+            "revenue_usd": 500.0,
+            "cpc": 0.10,
+            "ctr": 0.05,
+            "roas": 10.0,
+        }
+    ],
+    "count": 1,
+}
+
+BUDGET_UPDATE_RESULT = {
+    "success": True,
+    "campaign_id": "123",
+    "old_budget_usd": 100.0,
+    "new_budget_usd": 150.0,
+}
+
+PAUSE_RESULT = {"success": True, "campaign_id": "123", "action": "paused"}
+
+RESUME_RESULT = {"success": True, "campaign_id": "123", "action": "resumed"}
+
+
+@pytest.mark.usefixtures("override_platform_manager")
 class TestCampaignsAPI:
     """Tests for campaigns API endpoints"""
 
@@ -24,130 +58,64 @@ class TestCampaignsAPI:
         return user
 
     @pytest.fixture
-    def client(self, mock_user):
-        """Create test client with auth override"""
-        app.dependency_overrides[get_current_user] = lambda: mock_user
-        yield TestClient(app)
-        app.dependency_overrides.pop(get_current_user, None)
+    def async_client(self, async_client, app_instance, mock_user):
+        """ASGI test client with auth override"""
+        with override_dep(app_instance, get_current_user, lambda: mock_user):
+            yield async_client
 
     @pytest.fixture
-    def mock_platform_manager(self):
-        """Create mock platform manager"""
-        from app.services.platform_manager import PlatformManager
-
-        mock_manager = PlatformManager()
+    def override_platform_manager(self, app_instance, mock_platform_manager):
+        """Route get_platform_manager to the mock for the duration of a test"""
+        with override_dep(app_instance, get_platform_manager, lambda: mock_platform_manager):
+            yield
 
-        # Mock all client methods
-        for client in mock_manager.clients.values():
-            client.call_tool = AsyncMock()
-            client.ping = AsyncMock(return_value=True)
-
-        return mock_manager
-
-    def test_get_platforms_health(self, client, mock_platform_manager):
+    @pytest.mark.asyncio
+    async def test_get_platforms_health(self, async_client, mock_platform_manager):
         """Test health check endpoint"""
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.get("/api/platforms/health")
+        response = await async_client.get("/api/platforms/health")
 
         assert response.status_code == 200
         data = response.json()
         assert "status" in data
         assert "platforms" in data
 
-        app.dependency_overrides.clear()
-
-    def test_get_campaign_performance_single_platform(self, client, mock_platform_manager):
-        """Test getting campaign performance for single platform"""
-        mock_result = {
-            "campaigns": [
-                {
-                    "campaign_id": "123",
-                    "campaign_name": "Test Campaign",
-                    "status": "ENABLED",
-                    "budget_usd": 100.0,
-                    "impressions": 10000,
-                    "clicks": 500,
-                    "cost_usd": 50.0,
-                    "conversions": 10,
-                    "revenue_usd": 500.0,
-                    "cpc": 0.10,
-                    "ctr": 0.05,
-                    "roas": 10.0,
-                }
-            ],
-            "count": 1,
-        }
-
-        mock_platform_manager.clients["google_ads"].call_tool.return_value = mock_result
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.get(
-            "/api/campaigns/performance",
-            params={
-                "platforms": ["google_ads"],
-                "start_date": "2026-01-01",
-                "end_date": "2026-01-07",
-            },
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["count"] == 1
-        assert len(data["campaigns"]) == 1
-        assert data["campaigns"][0]["campaign_id"] == "123"
-        assert data["platforms_queried"] == ["google_ads"]
-
-        app.dependency_overrides.clear()
-
-    def test_get_campaign_performance_all_platforms(self, client, mock_platform_manager):
-        """Test getting campaign performance for all platforms"""
-        mock_result = {
-            "campaigns": [
-                {
-                    "campaign_id": "123",
-                    "campaign_name": "Test",
-                    "status": "ENABLED",
-                    "budget_usd": 100,
-                    "impressions": 1000,
-                    "clicks": 50,
-                    "cost_usd": 25,
-                    "conversions": 5,
-                    "revenue_usd": 250,
-                    "cpc": 0.5,
-                    "ctr": 0.05,
-                    "roas": 10,
-                }
-            ],
-            "count": 1,
-        }
-
+    @pytest.mark.parametrize(
+        "platforms,expected_count",
+        [
+            (["google_ads"], 1),
+            (None, 4),  # all platforms
+        ],
+        ids=["single_platform", "all_platforms"],
+    )
+    @pytest.mark.asyncio
+    async def test_get_campaign_performance(
+        self, async_client, mock_platform_manager, platforms, expected_count
+    ):
+        """Test getting campaign performance for one or all platforms"""
         for client_obj in mock_platform_manager.clients.values():
-            client_obj.call_tool.return_value = mock_result
+            client_obj.call_tool.return_value = CAMPAIGN_PERF_RESULT
 
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.get(
-            "/api/campaigns/performance",
-            params={"start_date": "2026-01-01", "end_date": "2026-01-07"},
-        )
+        params = {"start_date": "2026-01-01", "end_date": "2026-01-07"}
+        if platforms is not None:
+            params["platforms"] = platforms
+        response = await async_client.get("/api/campaigns/performance", params=params)
 
         assert response.status_code == 200
         data = response.json()
-        # Should have campaigns from all 4 platforms
-        assert data["count"] == 4
-        assert len(data["platforms_queried"]) == 4
-
-        app.dependency_overrides.clear()
+        assert data["count"] == expected_count
+        assert len(data["campaigns"]) == expected_count
+        assert data["campaigns"][0]["campaign_id"] == "123"
+        assert len(data["platforms_queried"]) == expected_count
+        if platforms is not None:
+            assert data["platforms_queried"] == platforms
 
-    def test_get_platform_specific_performance(self, client, mock_platform_manager):
+    @pytest.mark.asyncio
+    async def test_get_platform_specific_performance(self, async_client, mock_platform_manager):
         """Test getting performance for specific platform endpoint"""
         mock_result = {"campaigns": [{"campaign_id": "123"}], "count": 1, "platform": "google_ads"}
 
         mock_platform_manager.clients["google_ads"].call_tool.return_value = mock_result
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.get(
+        response = await async_client.get(
             "/api/campaigns/google_ads/performance",
             params={"start_date": "2026-01-01", "end_date": "2026-01-07"},
         )
@@ -156,13 +124,10 @@ class TestCampaignsAPI:
         data = response.json()
         assert data["platform"] == "google_ads"
 
-        app.dependency_overrides.clear()
-
-    def test_get_platform_invalid_platform(self, client, mock_platform_manager):
+    @pytest.mark.asyncio
+    async def test_get_platform_invalid_platform(self, async_client, mock_platform_manager):
         """Test invalid platform returns error"""
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.get(
+        response = await async_client.get(
             "/api/campaigns/invalid_platform/performance",
             params={"start_date": "2026-01-01", "end_date": "2026-01-07"},
         )
@@ -170,38 +135,10 @@ class TestCampaignsAPI:
         assert response.status_code == 400
         assert "Invalid platform" in response.json()["detail"]
 
-        app.dependency_overrides.clear()
-
-    def test_update_campaign_budget(self, client, mock_platform_manager):
-        """Test updating campaign budget"""
-        mock_result = {
-            "success": True,
-            "campaign_id": "123",
-            "old_budget_usd": 100.0,
-            "new_budget_usd": 150.0,
-        }
-
-        mock_platform_manager.clients["google_ads"].call_tool.return_value = mock_result
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.put(
-            "/api/campaigns/123/budget",
-            params={"platform": "google_ads"},
-            json={"new_budget": 150.0},
-        )
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["new_budget_usd"] == 150.0
-
-        app.dependency_overrides.clear()
-
-    def test_update_campaign_budget_invalid(self, client, mock_platform_manager):
+    @pytest.mark.asyncio
+    async def test_update_campaign_budget_invalid(self, async_client, mock_platform_manager):
         """Test updating budget with invalid amount"""
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.put(
+        response = await async_client.put(
             "/api/campaigns/123/budget",
             params={"platform": "google_ads"},
             json={"new_budget": -50.0},
@@ -210,36 +147,29 @@ class TestCampaignsAPI:
         assert response.status_code == 400
         assert "positive" in response.json()["detail"].lower()
 
-        app.dependency_overrides.clear()
-
-    def test_pause_campaign(self, client, mock_platform_manager):
-        """Test pausing a campaign"""
-        mock_result = {"success": True, "campaign_id": "123", "action": "paused"}
-
-        mock_platform_manager.clients["google_ads"].call_tool.return_value = mock_result
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.post("/api/campaigns/123/pause", params={"platform": "google_ads"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["action"] == "paused"
-
-        app.dependency_overrides.clear()
-
-    def test_resume_campaign(self, client, mock_platform_manager):
-        """Test resuming a campaign"""
-        mock_result = {"success": True, "campaign_id": "123", "action": "resumed"}
-
+    @pytest.mark.parametrize(
+        "method,path,body,mock_result,expected",
+        [
+            ("post", "/api/campaigns/123/pause", None, PAUSE_RESULT, {"action": "paused"}),
+            ("post", "/api/campaigns/123/resume", None, RESUME_RESULT, {"action": "resumed"}),
+            (
+                "put",
+                "/api/campaigns/123/budget",
+                {"new_budget": 150.0},
+                BUDGET_UPDATE_RESULT,
+                {"new_budget_usd": 150.0},
+            ),
+        ],
+        ids=["pause", "resume", "update_budget"],
+    )
+    @pytest.mark.asyncio
+    async def test_campaign_action(
+        self, async_client, mock_platform_manager, method, path, body, mock_result, expected
+    ):
+        """Test pausing, resuming and re-budgeting a campaign"""
         mock_platform_manager.clients["google_ads"].call_tool.return_value = mock_result
-        app.dependency_overrides[get_platform_manager] = lambda: mock_platform_manager
-
-        response = client.post("/api/campaigns/123/resume", params={"platform": "google_ads"})
-
-        assert response.status_code == 200
-        data = response.json()
-        assert data["success"] is True
-        assert data["action"] == "resumed"
+        response = await async_client.request(
+            method, path, params={"platform": "google_ads"}, json=body
+        )
 
-        app.dependency_overrides.clear()
+        assert_success_response(response, **expected)
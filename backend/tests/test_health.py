@@ -1,15 +1,5 @@
 """Tests for health check endpoints"""
 
-import pytest
-from app.main import app
-from fastapi.testclient import TestClient
-
-
-@pytest.fixture
-def client():
-    """Create test client"""
-    return TestClient(app)
-
 
 def test_health_check(client):
     """Test basic health endpoint"""
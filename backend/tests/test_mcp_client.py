@@ -1,127 +1,144 @@
 """Tests for MCP client and platform manager"""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
+import respx
 from app.services.mcp_client import MCPClient
-from app.services.platform_manager import PlatformManager
+
+from tests._helpers import make_mcp_response
+
+MCP_SERVER_URL = "http://localhost:3001"
+
+
+@pytest.fixture(scope="module")
+def mcp_router():
+    """respx router intercepting HTTP traffic to the test MCP server"""
+    with respx.mock(base_url=MCP_SERVER_URL, assert_all_called=False) as router:
+        yield router
 
 
 class TestMCPClient:
     """Tests for MCPClient"""
 
-    @pytest.fixture
-    def mcp_client(self):
-        """Create MCP client for testing"""
-        return MCPClient(server_url="http://localhost:3001", server_name="test-mcp")
+    @pytest.fixture(scope="module")
+    async def mcp_client(self):
+        """MCP client shared across the module"""
+        client = MCPClient(
+            server_url=MCP_SERVER_URL, server_name="test-mcp", ping_url=f"{MCP_SERVER_URL}/health"
+        )
+        yield client
+        await client.close()
+
+    @pytest.fixture(autouse=True)
+    def _reset_router(self, mcp_router):
+        """Clear recorded calls so per-test call counts start from zero"""
+        mcp_router.reset()
 
     @pytest.mark.asyncio
-    async def test_call_tool_success(self, mcp_client):
+    async def test_call_tool_success(self, mcp_client, mcp_router):
         """Test successful tool call"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {"campaigns": [{"campaign_id": "123", "name": "Test Campaign"}]},
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(mcp_client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
-
-            result = await mcp_client.call_tool(
-                tool_name="get_campaign_performance",
-                arguments={"date_range": {"start_date": "2026-01-01", "end_date": "2026-01-07"}},
+        route = mcp_router.post("/").mock(
+            return_value=make_mcp_response(
+                {"result": {"campaigns": [{"campaign_id": "123", "name": "Test Campaign"}]}}
             )
+        )
 
-            assert "campaigns" in result
-            assert len(result["campaigns"]) == 1
-            mock_post.assert_called_once()
+        result = await mcp_client.call_tool(
+            tool_name="get_campaign_performance",
+            arguments={"date_range": {"start_date": "2026-01-01", "end_date": "2026-01-07"}},
+        )
+
+        assert "campaigns" in result
+        assert len(result["campaigns"]) == 1
+        assert route.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_call_tool_error_response(self, mcp_client):
+    async def test_call_tool_error_response(self, mcp_client, mcp_router):
         """Test tool call with error response"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {"code": -32000, "message": "Campaign not found"},
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(mcp_client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        mcp_router.post("/").mock(
+            return_value=make_mcp_response(
+                {"error": {"code": -32000, "message": "Campaign not found"}}
+            )
+        )
 
-            with pytest.raises(Exception) as exc_info:
-                await mcp_client.call_tool(
-                    tool_name="pause_campaign", arguments={"campaign_id": "invalid"}
-                )
+        with pytest.raises(Exception) as exc_info:
+            await mcp_client.call_tool(
+                tool_name="pause_campaign", arguments={"campaign_id": "invalid"}
+            )
 
-            assert "MCP Error" in str(exc_info.value)
+        assert "MCP Error" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_list_tools(self, mcp_client):
+    async def test_list_tools(self, mcp_client, mcp_router):
         """Test listing available tools"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "result": {
-                "tools": [
-                    {"name": "get_campaign_performance"},
-                    {"name": "update_campaign_budget"},
-                    {"name": "pause_campaign"},
-                    {"name": "resume_campaign"},
-                ]
-            },
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(mcp_client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        mcp_router.post("/").mock(
+            return_value=make_mcp_response(
+                {
+                    "result": {
+                        "tools": [
+                            {"name": "get_campaign_performance"},
+                            {"name": "update_campaign_budget"},
+                            {"name": "pause_campaign"},
+                            {"name": "resume_campaign"},
+                        ]
+                    }
+                }
+            )
+        )
 
-            tools = await mcp_client.list_tools()
+        tools = await mcp_client.list_tools()
 
-            assert len(tools) == 4
-            assert tools[0]["name"] == "get_campaign_performance"
+        assert len(tools) == 4
+        assert tools[0]["name"] == "get_campaign_performance"
 
     @pytest.mark.asyncio
-    async def test_ping_success(self, mcp_client):
+    async def test_ping_success(self, mcp_client, mcp_router):
         """Test ping when server is available"""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"jsonrpc": "2.0", "id": 1, "result": {"tools": []}}
-        mock_response.raise_for_status = MagicMock()
+        head = mcp_router.head("/health").mock(return_value=httpx.Response(200))
+        post = mcp_router.post("/")
 
-        with patch.object(mcp_client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        result = await mcp_client.ping()
 
-            result = await mcp_client.ping()
+        assert result is True
+        assert head.call_count == 1
+        assert post.call_count == 0
 
-            assert result is True
+    @pytest.mark.asyncio
+    async def test_ping_falls_back_to_list_tools(self, mcp_client, mcp_router):
+        """Test ping uses tools/list when the server rejects HEAD"""
+        mcp_router.head("/health").mock(return_value=httpx.Response(405))
+        post = mcp_router.post("/").mock(return_value=make_mcp_response({"result": {"tools": []}}))
+
+        result = await mcp_client.ping()
+
+        assert result is True
+        assert post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ping_not_found_is_not_alive(self, mcp_client, mcp_router):
+        """Test a 404 from a non-MCP listener is not reported as healthy"""
+        mcp_router.head("/health").mock(return_value=httpx.Response(404))
+        mcp_router.post("/").mock(return_value=httpx.Response(404))
+
+        result = await mcp_client.ping()
+
+        assert result is False
 
     @pytest.mark.asyncio
-    async def test_ping_failure(self, mcp_client):
+    async def test_ping_failure(self, mcp_client, mcp_router):
         """Test ping when server is unavailable"""
-        with patch.object(mcp_client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.side_effect = Exception("Connection refused")
+        mcp_router.head("/health").mock(side_effect=httpx.ConnectError("Connection refused"))
 
-            result = await mcp_client.ping()
+        result = await mcp_client.ping()
 
-            assert result is False
+        assert result is False
 
 
 class TestPlatformManager:
     """Tests for PlatformManager"""
 
-    @pytest.fixture
-    def platform_manager(self):
-        """Create platform manager for testing"""
-        return PlatformManager()
-
     def test_initialization(self, platform_manager):
         """Test platform manager initializes all clients"""
         assert "google_ads" in platform_manager.clients
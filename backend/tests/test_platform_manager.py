@@ -1,13 +1,29 @@
 """Comprehensive tests for PlatformManager and MCPClient"""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import dataclasses
+from unittest.mock import AsyncMock, patch
 
 import httpx
+import orjson
 import pytest
-
+from app.core.config import settings
 from app.services.mcp_client import MCPClient
 from app.services.platform_manager import MCPConfig, PlatformManager
 
+from tests._helpers import make_mcp_response
+
+
+def install_client_mocks(manager, mapping, method="call_tool"):
+    """Install one AsyncMock per platform on method; exception values become side effects"""
+    for platform, value in mapping.items():
+        mock = (
+            AsyncMock(side_effect=value)
+            if isinstance(value, BaseException)
+            else AsyncMock(return_value=value)
+        )
+        setattr(manager.clients[platform], method, mock)
+
 
 class TestMCPConfig:
     """Tests for MCPConfig dataclass"""
@@ -31,6 +47,15 @@ class TestMCPConfig:
         assert config.host == "192.168.1.100"
         assert config.google_ads_port == 4001
 
+    def test_config_is_frozen(self):
+        config = MCPConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.host = "example.com"
+
+    def test_from_settings_follows_settings(self, monkeypatch):
+        monkeypatch.setattr(settings, "mcp_host", "mcp.internal")
+        assert MCPConfig.from_settings().host == "mcp.internal"
+
 
 class TestMCPClient:
     """Tests for MCPClient JSON-RPC client"""
@@ -43,13 +68,11 @@ class TestMCPClient:
 
     @pytest.mark.asyncio
     async def test_call_tool_success(self, client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = make_mcp_response({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {"campaigns": [], "count": 0},
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
         with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
@@ -64,13 +87,11 @@ class TestMCPClient:
 
     @pytest.mark.asyncio
     async def test_call_tool_error_response(self, client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = make_mcp_response({
             "jsonrpc": "2.0",
             "id": 1,
             "error": {"code": -32600, "message": "Invalid Request"},
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
         with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
@@ -90,10 +111,21 @@ class TestMCPClient:
 
             assert "HTTP error" in str(exc_info.value)
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [302, 502])
+    async def test_call_tool_http_status_error(self, client, status):
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = httpx.Response(status, headers={"Location": "/elsewhere"})
+
+            with pytest.raises(Exception) as exc_info:
+                await client.call_tool("get_campaign_performance", {})
+
+            assert "HTTP error" in str(exc_info.value)
+            assert str(status) in str(exc_info.value)
+
     @pytest.mark.asyncio
     async def test_list_tools_success(self, client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response = make_mcp_response({
             "jsonrpc": "2.0",
             "id": 1,
             "result": {
@@ -102,8 +134,7 @@ class TestMCPClient:
                     {"name": "update_campaign_budget"},
                 ]
             },
-        }
-        mock_response.raise_for_status = MagicMock()
+        })
 
         with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
@@ -115,15 +146,25 @@ class TestMCPClient:
 
     @pytest.mark.asyncio
     async def test_ping_success(self, client):
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"result": {"tools": []}}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
-            mock_post.return_value = mock_response
+        with (
+            patch.object(client.client, "post", new_callable=AsyncMock) as mock_post,
+            patch.object(client.client, "head", new_callable=AsyncMock) as mock_head,
+        ):
+            mock_post.return_value = make_mcp_response({"result": {"tools": []}})
 
             result = await client.ping()
             assert result is True
+            mock_post.assert_called_once()
+            mock_head.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ping_server_error(self, client):
+        client.ping_url = "http://localhost:3001/health"
+        with patch.object(client.client, "head", new_callable=AsyncMock) as mock_head:
+            mock_head.return_value = httpx.Response(503)
+
+            result = await client.ping()
+            assert result is False
 
     @pytest.mark.asyncio
     async def test_ping_failure(self, client):
@@ -134,21 +175,129 @@ class TestMCPClient:
             assert result is False
 
     @pytest.mark.asyncio
-    async def test_request_id_increments(self, client):
-        assert client.request_id == 0
+    async def test_ping_does_not_wait_for_busy_semaphore(self, client):
+        client._semaphore = asyncio.Semaphore(0)  # Every slot taken by in-flight calls
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_mcp_response({"result": {"tools": []}})
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"result": {}}
-        mock_response.raise_for_status = MagicMock()
+            assert await asyncio.wait_for(client.ping(), timeout=1) is True
+
+    @pytest.mark.asyncio
+    async def test_ping_times_out(self, client):
+        async def hang(*args, **kwargs):
+            await asyncio.sleep(10)
+
+        with (
+            patch("app.services.mcp_client._PING_TIMEOUT", 0.05),
+            patch.object(client.client, "post", new_callable=AsyncMock) as mock_post,
+        ):
+            mock_post.side_effect = hang
+
+            assert await client.ping() is False
+
+    @pytest.mark.asyncio
+    async def test_request_id_increments(self, client):
+        mock_response = make_mcp_response({"result": {}})
 
         with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
             mock_post.return_value = mock_response
 
             await client.call_tool("test", {})
-            assert client.request_id == 1
-
             await client.call_tool("test", {})
-            assert client.request_id == 2
+            await client.list_tools()
+
+            sent_ids = [
+                orjson.loads(call.kwargs["content"])["id"] for call in mock_post.call_args_list
+            ]
+            assert sent_ids == [1, 2, 3]
+            assert client.request_id == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_get_unique_ids(self, client):
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_mcp_response({"result": {}})
+
+            await asyncio.gather(*(client.call_tool("test", {}) for _ in range(10)))
+
+            sent_ids = {
+                orjson.loads(call.kwargs["content"])["id"] for call in mock_post.call_args_list
+            }
+            assert sent_ids == set(range(1, 11))
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batch_orders_results_by_id(self, client):
+        # Server answers out of order, with one failed call
+        mock_response = make_mcp_response([
+            {"jsonrpc": "2.0", "id": 2, "error": {"code": -32000, "message": "Not found"}},
+            {"jsonrpc": "2.0", "id": 1, "result": {"campaign_id": "a"}},
+            {"jsonrpc": "2.0", "id": 3, "result": {"campaign_id": "c"}},
+        ])
+
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = mock_response
+
+            results = await client.call_tools_batch(
+                [
+                    ("pause_campaign", {"campaign_id": "a"}),
+                    ("pause_campaign", {"campaign_id": "b"}),
+                    ("pause_campaign", {"campaign_id": "c"}),
+                ]
+            )
+
+            mock_post.assert_called_once()
+            sent = orjson.loads(mock_post.call_args.kwargs["content"])
+            assert [item["id"] for item in sent] == [1, 2, 3]
+
+        assert results[0] == {"campaign_id": "a"}
+        assert isinstance(results[1], Exception)
+        assert "MCP Error" in str(results[1])
+        assert results[2] == {"campaign_id": "c"}
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batch_skips_non_object_entries(self, client):
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            mock_post.return_value = make_mcp_response(
+                [None, "garbage", {"jsonrpc": "2.0", "id": 1, "result": {"campaign_id": "a"}}]
+            )
+
+            results = await client.call_tools_batch(
+                [
+                    ("pause_campaign", {"campaign_id": "a"}),
+                    ("pause_campaign", {"campaign_id": "b"}),
+                ]
+            )
+
+        assert results[0] == {"campaign_id": "a"}
+        assert isinstance(results[1], Exception)
+        assert "no response for id 2" in str(results[1])
+
+    @pytest.mark.asyncio
+    async def test_call_tools_batch_empty(self, client):
+        with patch.object(client.client, "post", new_callable=AsyncMock) as mock_post:
+            assert await client.call_tools_batch([]) == []
+            mock_post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_bounded(self):
+        client = MCPClient(
+            server_url="http://localhost:3001", server_name="google-ads-mcp", max_concurrency=2
+        )
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return make_mcp_response({"result": {}})
+
+        with patch.object(client.client, "post", side_effect=slow_post):
+            await asyncio.gather(*(client.call_tool("test", {}) for _ in range(6)))
+
+        assert peak == 2
+        await client.close()
 
     @pytest.mark.asyncio
     async def test_close(self, client):
@@ -156,61 +305,54 @@ class TestMCPClient:
             await client.close()
             mock_close.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_close_leaves_shared_client_open(self):
+        shared = httpx.AsyncClient()
+        client = MCPClient(
+            server_url="http://localhost:3001", server_name="google-ads-mcp", client=shared
+        )
+
+        await client.close()
+
+        assert client.client is shared
+        assert not shared.is_closed
+        await shared.aclose()
+
 
 class TestPlatformManager:
     """Tests for PlatformManager unified interface"""
 
-    @pytest.fixture
-    def config(self):
-        return MCPConfig(
-            host="localhost",
-            google_ads_port=3001,
-            meta_ads_port=3002,
-            tiktok_ads_port=3003,
-            linkedin_ads_port=3004,
-        )
+    def test_init_creates_clients(self, platform_manager):
+        assert "google_ads" in platform_manager.clients
+        assert "meta_ads" in platform_manager.clients
+        assert "tiktok_ads" in platform_manager.clients
+        assert "linkedin_ads" in platform_manager.clients
 
-    @pytest.fixture
-    def manager(self, config):
-        with patch("app.services.platform_manager.settings") as mock_settings:
-            mock_settings.mcp_host = "localhost"
-            mock_settings.mcp_google_ads_port = 3001
-            mock_settings.mcp_meta_ads_port = 3002
-            mock_settings.mcp_tiktok_ads_port = 3003
-            mock_settings.mcp_linkedin_ads_port = 3004
-            return PlatformManager(config)
-
-    def test_init_creates_clients(self, manager):
-        assert "google_ads" in manager.clients
-        assert "meta_ads" in manager.clients
-        assert "tiktok_ads" in manager.clients
-        assert "linkedin_ads" in manager.clients
-
-    def test_get_client_valid_platform(self, manager):
-        client = manager._get_client("google_ads")
+    def test_get_client_valid_platform(self, platform_manager):
+        client = platform_manager._get_client("google_ads")
         assert client is not None
         assert client.server_name == "google-ads-mcp"
 
-    def test_get_client_invalid_platform(self, manager):
+    def test_get_client_invalid_platform(self, platform_manager):
         with pytest.raises(ValueError) as exc_info:
-            manager._get_client("invalid_platform")
+            platform_manager._get_client("invalid_platform")
 
         assert "Unknown platform" in str(exc_info.value)
         assert "invalid_platform" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_get_campaign_performance(self, manager):
+    async def test_get_campaign_performance(self, platform_manager):
         mock_result = {
             "campaigns": [{"id": "123", "name": "Test Campaign"}],
             "count": 1,
         }
 
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = mock_result
 
-            result = await manager.get_campaign_performance(
+            result = await platform_manager.get_campaign_performance(
                 platform="google_ads",
                 start_date="2024-01-01",
                 end_date="2024-01-31",
@@ -223,13 +365,13 @@ class TestPlatformManager:
             )
 
     @pytest.mark.asyncio
-    async def test_get_campaign_performance_with_ids(self, manager):
+    async def test_get_campaign_performance_with_ids(self, platform_manager):
         with patch.object(
-            manager.clients["meta_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["meta_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"campaigns": []}
 
-            await manager.get_campaign_performance(
+            await platform_manager.get_campaign_performance(
                 platform="meta_ads",
                 start_date="2024-01-01",
                 end_date="2024-01-31",
@@ -240,14 +382,109 @@ class TestPlatformManager:
             assert call_args["campaign_ids"] == ["123", "456"]
 
     @pytest.mark.asyncio
-    async def test_update_campaign_budget_google_ads(self, manager):
+    async def test_get_campaign_performance_is_cached(self, platform_manager):
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+        ) as mock_call:
+            mock_call.return_value = {"campaigns": []}
+
+            first = await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            second = await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            await platform_manager.get_campaign_performance("google_ads", "2024-02-01", "2024-02-29")
+
+            assert first == second
+            assert mock_call.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_performance_is_copied(self, platform_manager):
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+        ) as mock_call:
+            mock_call.return_value = {"campaigns": [{"id": "g1"}]}
+
+            first = await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            first["campaigns"][0]["platform"] = "google_ads"
+            second = await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            second["campaigns"].clear()
+            third = await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+
+            assert third == {"campaigns": [{"id": "g1"}]}
+            assert mock_call.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_perf_cache_evicts_least_recently_used(self, platform_manager, monkeypatch):
+        monkeypatch.setattr(
+            platform_manager, "config", dataclasses.replace(platform_manager.config, perf_cache_maxsize=2)
+        )
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+        ) as mock_call:
+            mock_call.return_value = {"campaigns": []}
+
+            for month in ("01", "02", "01", "03", "01", "02"):
+                await platform_manager.get_campaign_performance("google_ads", f"2024-{month}-01", "2024-12-31")
+
+            # 01, 02, 03 miss; 01 stays recent; 03 evicts 02, which then misses again
+            assert mock_call.call_count == 4
+            assert len(platform_manager._perf_cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_perf_entries_are_dropped(self, platform_manager):
+        with (
+            patch.object(
+                platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            ) as mock_call,
+            patch("app.services.platform_manager.time.monotonic", return_value=1000.0) as clock,
+        ):
+            mock_call.return_value = {"campaigns": []}
+
+            await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            clock.return_value += platform_manager.config.perf_cache_ttl_seconds
+            mock_call.side_effect = Exception("Connection failed")
+            with pytest.raises(Exception, match="Connection failed"):
+                await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+
+            assert mock_call.call_count == 2
+            assert not platform_manager._perf_cache
+
+    @pytest.mark.asyncio
+    async def test_invalidation_during_fetch_is_not_overwritten(self, platform_manager):
+        async def fetch_while_paused(*args, **kwargs):
+            platform_manager.invalidate_cache("google_ads")
+            return {"campaigns": [{"id": "g1", "status": "ENABLED"}]}
+
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+        ) as mock_call:
+            mock_call.side_effect = fetch_while_paused
+
+            await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+
+            assert mock_call.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_mutation_invalidates_platform_cache(self, platform_manager):
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+        ) as mock_call:
+            mock_call.return_value = {"campaigns": [], "success": True}
+
+            await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+            await platform_manager.pause_campaign("google_ads", "123")
+            await platform_manager.get_campaign_performance("google_ads", "2024-01-01", "2024-01-31")
+
+            assert mock_call.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_update_campaign_budget_google_ads(self, platform_manager):
         """Google Ads uses micros format"""
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget(
+            await platform_manager.update_campaign_budget(
                 platform="google_ads",
                 campaign_id="123",
                 new_budget=50.00,
@@ -258,14 +495,14 @@ class TestPlatformManager:
             assert "new_budget" not in call_args
 
     @pytest.mark.asyncio
-    async def test_update_campaign_budget_meta_ads(self, manager):
+    async def test_update_campaign_budget_meta_ads(self, platform_manager):
         """Meta Ads uses standard currency"""
         with patch.object(
-            manager.clients["meta_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["meta_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget(
+            await platform_manager.update_campaign_budget(
                 platform="meta_ads",
                 campaign_id="456",
                 new_budget=100.00,
@@ -276,13 +513,39 @@ class TestPlatformManager:
             assert "new_budget_micros" not in call_args
 
     @pytest.mark.asyncio
-    async def test_pause_campaign(self, manager):
+    async def test_update_campaign_budgets_bulk(self, platform_manager):
+        with patch.object(
+            platform_manager.clients["google_ads"], "call_tools_batch", new_callable=AsyncMock
+        ) as mock_batch:
+            mock_batch.return_value = [{"success": True}, {"success": True}]
+
+            results = await platform_manager.update_campaign_budgets_bulk(
+                platform="google_ads",
+                updates={"123": 50.00, "456": 75.00},
+            )
+
+            mock_batch.assert_called_once_with(
+                [
+                    (
+                        "update_campaign_budget",
+                        {"campaign_id": "123", "new_budget_micros": 50_000_000},
+                    ),
+                    (
+                        "update_campaign_budget",
+                        {"campaign_id": "456", "new_budget_micros": 75_000_000},
+                    ),
+                ]
+            )
+            assert results == {"123": {"success": True}, "456": {"success": True}}
+
+    @pytest.mark.asyncio
+    async def test_pause_campaign(self, platform_manager):
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True, "action": "paused"}
 
-            result = await manager.pause_campaign(
+            result = await platform_manager.pause_campaign(
                 platform="google_ads",
                 campaign_id="123",
             )
@@ -293,13 +556,13 @@ class TestPlatformManager:
             )
 
     @pytest.mark.asyncio
-    async def test_resume_campaign(self, manager):
+    async def test_resume_campaign(self, platform_manager):
         with patch.object(
-            manager.clients["tiktok_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["tiktok_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True, "action": "resumed"}
 
-            result = await manager.resume_campaign(
+            result = await platform_manager.resume_campaign(
                 platform="tiktok_ads",
                 campaign_id="789",
             )
@@ -310,18 +573,18 @@ class TestPlatformManager:
             )
 
     @pytest.mark.asyncio
-    async def test_get_all_campaigns(self, manager):
-        mock_results = {
-            "google_ads": {"campaigns": [{"id": "g1"}]},
-            "meta_ads": {"campaigns": [{"id": "m1"}]},
-            "tiktok_ads": {"campaigns": []},
-            "linkedin_ads": {"campaigns": []},
-        }
-
-        for platform, result in mock_results.items():
-            manager.clients[platform].call_tool = AsyncMock(return_value=result)
+    async def test_get_all_campaigns(self, platform_manager):
+        install_client_mocks(
+            platform_manager,
+            {
+                "google_ads": {"campaigns": [{"id": "g1"}]},
+                "meta_ads": {"campaigns": [{"id": "m1"}]},
+                "tiktok_ads": {"campaigns": []},
+                "linkedin_ads": {"campaigns": []},
+            },
+        )
 
-        results = await manager.get_all_campaigns(
+        results = await platform_manager.get_all_campaigns(
             start_date="2024-01-01",
             end_date="2024-01-31",
         )
@@ -331,173 +594,215 @@ class TestPlatformManager:
         assert results["google_ads"]["campaigns"][0]["id"] == "g1"
 
     @pytest.mark.asyncio
-    async def test_get_all_campaigns_with_error(self, manager):
-        manager.clients["google_ads"].call_tool = AsyncMock(
-            return_value={"campaigns": []}
+    async def test_get_all_campaigns_with_error(self, platform_manager):
+        install_client_mocks(
+            platform_manager,
+            {
+                "google_ads": {"campaigns": []},
+                "meta_ads": Exception("Connection failed"),
+                "tiktok_ads": {"campaigns": []},
+                "linkedin_ads": {"campaigns": []},
+            },
         )
-        manager.clients["meta_ads"].call_tool = AsyncMock(
-            side_effect=Exception("Connection failed")
+
+        results = await platform_manager.get_all_campaigns(
+            start_date="2024-01-01",
+            end_date="2024-01-31",
         )
-        manager.clients["tiktok_ads"].call_tool = AsyncMock(
-            return_value={"campaigns": []}
+
+        assert "error" in results["meta_ads"]
+        assert "Connection failed" in results["meta_ads"]["error"]
+        assert "campaigns" in results["google_ads"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_platform_is_reported_as_failure(self, platform_manager):
+        """CancelledError is a BaseException and must not pass as a result"""
+        install_client_mocks(
+            platform_manager,
+            {
+                "google_ads": {"campaigns": []},
+                "meta_ads": asyncio.CancelledError(),
+                "tiktok_ads": {"campaigns": []},
+                "linkedin_ads": {"campaigns": []},
+            },
         )
-        manager.clients["linkedin_ads"].call_tool = AsyncMock(
-            return_value={"campaigns": []}
+        install_client_mocks(
+            platform_manager,
+            {
+                "google_ads": True,
+                "meta_ads": asyncio.CancelledError(),
+                "tiktok_ads": True,
+                "linkedin_ads": True,
+            },
+            method="ping",
         )
 
-        results = await manager.get_all_campaigns(
+        results = await platform_manager.get_all_campaigns(
             start_date="2024-01-01",
             end_date="2024-01-31",
         )
+        health = await platform_manager.health_check()
 
         assert "error" in results["meta_ads"]
-        assert "Connection failed" in results["meta_ads"]["error"]
-        assert "campaigns" in results["google_ads"]
+        assert health["meta_ads"] is False
+        assert health["google_ads"] is True
 
     @pytest.mark.asyncio
-    async def test_health_check_all_healthy(self, manager):
-        for client in manager.clients.values():
+    async def test_health_check_all_healthy(self, platform_manager):
+        for client in platform_manager.clients.values():
             client.ping = AsyncMock(return_value=True)
 
-        health = await manager.health_check()
+        health = await platform_manager.health_check()
 
         assert all(status is True for status in health.values())
 
     @pytest.mark.asyncio
-    async def test_health_check_partial_failure(self, manager):
-        manager.clients["google_ads"].ping = AsyncMock(return_value=True)
-        manager.clients["meta_ads"].ping = AsyncMock(side_effect=Exception("Down"))
-        manager.clients["tiktok_ads"].ping = AsyncMock(return_value=True)
-        manager.clients["linkedin_ads"].ping = AsyncMock(return_value=False)
+    async def test_health_check_partial_failure(self, platform_manager):
+        install_client_mocks(
+            platform_manager,
+            {
+                "google_ads": True,
+                "meta_ads": Exception("Down"),
+                "tiktok_ads": True,
+                "linkedin_ads": False,
+            },
+            method="ping",
+        )
 
-        health = await manager.health_check()
+        health = await platform_manager.health_check()
 
         assert health["google_ads"] is True
         assert health["meta_ads"] is False
         assert health["tiktok_ads"] is True
         assert health["linkedin_ads"] is False
 
-    @pytest.mark.asyncio
-    async def test_close_all(self, manager):
-        for client in manager.clients.values():
-            client.close = AsyncMock()
-
-        await manager.close_all()
+    def test_clients_share_http_client(self, platform_manager):
+        http_clients = {id(client.client) for client in platform_manager.clients.values()}
+        assert http_clients == {id(platform_manager._http)}
 
-        for client in manager.clients.values():
-            client.close.assert_called_once()
+    @pytest.mark.asyncio
+    async def test_close_all(self, platform_manager):
+        with patch.object(platform_manager._http, "aclose", new_callable=AsyncMock) as mock_close:
+            await platform_manager.close_all()
+            mock_close.assert_called_once()
 
 
 class TestBudgetConversion:
     """Tests for budget format conversion"""
 
-    @pytest.fixture
-    def manager(self):
-        config = MCPConfig()
-        with patch("app.services.platform_manager.settings") as mock_settings:
-            mock_settings.mcp_host = "localhost"
-            mock_settings.mcp_google_ads_port = 3001
-            mock_settings.mcp_meta_ads_port = 3002
-            mock_settings.mcp_tiktok_ads_port = 3003
-            mock_settings.mcp_linkedin_ads_port = 3004
-            return PlatformManager(config)
-
     @pytest.mark.asyncio
-    async def test_small_budget_conversion(self, manager):
+    async def test_small_budget_conversion(self, platform_manager):
         """Test $1 budget converts correctly"""
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget("google_ads", "123", 1.00)
+            await platform_manager.update_campaign_budget("google_ads", "123", 1.00)
 
             call_args = mock_call.call_args[0][1]
             assert call_args["new_budget_micros"] == 1_000_000
 
     @pytest.mark.asyncio
-    async def test_large_budget_conversion(self, manager):
+    async def test_large_budget_conversion(self, platform_manager):
         """Test $10,000 budget converts correctly"""
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget("google_ads", "123", 10000.00)
+            await platform_manager.update_campaign_budget("google_ads", "123", 10000.00)
 
             call_args = mock_call.call_args[0][1]
             assert call_args["new_budget_micros"] == 10_000_000_000
 
     @pytest.mark.asyncio
-    async def test_fractional_budget_conversion(self, manager):
+    async def test_fractional_budget_conversion(self, platform_manager):
         """Test $50.50 budget converts correctly"""
         with patch.object(
-            manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["google_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget("google_ads", "123", 50.50)
+            await platform_manager.update_campaign_budget("google_ads", "123", 50.50)
 
             call_args = mock_call.call_args[0][1]
             assert call_args["new_budget_micros"] == 50_500_000
 
 
+    @pytest.mark.parametrize(
+        "budget,expected_micros",
+        [(8.20, 8_200_000), (49.99, 49_990_000), (0.01, 10_000)],
+    )
+    def test_budget_conversion_has_no_float_truncation(self, platform_manager, budget, expected_micros):
+        """int(8.20 * 1_000_000) truncates to 8_199_999; cents-based conversion must not"""
+        args = platform_manager._budget_args("google_ads", "123", budget)
+        assert args["new_budget_micros"] == expected_micros
+        assert isinstance(args["new_budget_micros"], int)
+
+    def test_standard_budget_rounds_to_cents(self, platform_manager):
+        args = platform_manager._budget_args("meta_ads", "123", 50.505)
+        assert args["new_budget"] == 50.5
+
+    def test_unknown_platform_budget_format(self, platform_manager):
+        with pytest.raises(ValueError) as exc_info:
+            platform_manager._budget_args("invalid_platform", "123", 10.00)
+
+        assert "Unknown platform" in str(exc_info.value)
+
+
 class TestPlatformSpecificBehavior:
     """Tests for platform-specific behavior"""
 
-    @pytest.fixture
-    def manager(self):
-        config = MCPConfig()
-        with patch("app.services.platform_manager.settings") as mock_settings:
-            mock_settings.mcp_host = "localhost"
-            mock_settings.mcp_google_ads_port = 3001
-            mock_settings.mcp_meta_ads_port = 3002
-            mock_settings.mcp_tiktok_ads_port = 3003
-            mock_settings.mcp_linkedin_ads_port = 3004
-            return PlatformManager(config)
-
-    def test_google_ads_uses_correct_port(self, manager):
-        client = manager.clients["google_ads"]
+    def test_google_ads_uses_correct_port(self, platform_manager):
+        client = platform_manager.clients["google_ads"]
         assert "3001" in client.server_url
 
-    def test_meta_ads_uses_correct_port(self, manager):
-        client = manager.clients["meta_ads"]
+    def test_meta_ads_uses_correct_port(self, platform_manager):
+        client = platform_manager.clients["meta_ads"]
         assert "3002" in client.server_url
 
-    def test_tiktok_ads_uses_correct_port(self, manager):
-        client = manager.clients["tiktok_ads"]
+    def test_tiktok_ads_uses_correct_port(self, platform_manager):
+        client = platform_manager.clients["tiktok_ads"]
         assert "3003" in client.server_url
 
-    def test_linkedin_ads_uses_correct_port(self, manager):
-        client = manager.clients["linkedin_ads"]
+    def test_ping_endpoint_is_appended(self):
+        platform_manager = PlatformManager(MCPConfig(ping_endpoint="/health"))
+        assert platform_manager.clients["meta_ads"].ping_url == "http://localhost:3002/health"
+
+    def test_no_ping_endpoint_probes_with_tools_list(self, platform_manager):
+        assert all(client.ping_url is None for client in platform_manager.clients.values())
+
+    def test_linkedin_ads_uses_correct_port(self, platform_manager):
+        client = platform_manager.clients["linkedin_ads"]
         assert "3004" in client.server_url
 
-    def test_each_platform_has_unique_server_name(self, manager):
-        names = [client.server_name for client in manager.clients.values()]
+    def test_each_platform_has_unique_server_name(self, platform_manager):
+        names = [client.server_name for client in platform_manager.clients.values()]
         assert len(names) == len(set(names))
 
     @pytest.mark.asyncio
-    async def test_tiktok_uses_standard_budget(self, manager):
+    async def test_tiktok_uses_standard_budget(self, platform_manager):
         """TikTok uses standard currency like Meta"""
         with patch.object(
-            manager.clients["tiktok_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["tiktok_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget("tiktok_ads", "123", 75.00)
+            await platform_manager.update_campaign_budget("tiktok_ads", "123", 75.00)
 
             call_args = mock_call.call_args[0][1]
             assert call_args["new_budget"] == 75.00
 
     @pytest.mark.asyncio
-    async def test_linkedin_uses_standard_budget(self, manager):
+    async def test_linkedin_uses_standard_budget(self, platform_manager):
         """LinkedIn uses standard currency"""
         with patch.object(
-            manager.clients["linkedin_ads"], "call_tool", new_callable=AsyncMock
+            platform_manager.clients["linkedin_ads"], "call_tool", new_callable=AsyncMock
         ) as mock_call:
             mock_call.return_value = {"success": True}
 
-            await manager.update_campaign_budget("linkedin_ads", "123", 200.00)
+            await platform_manager.update_campaign_budget("linkedin_ads", "123", 200.00)
 
             call_args = mock_call.call_args[0][1]
             assert call_args["new_budget"] == 200.00